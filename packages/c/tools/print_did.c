@@ -2,6 +2,10 @@
  * Simple tool to print DID for a given private key.
  * Used for cross-SDK compatibility testing.
  *
+ * Usage: print_did [hex_key]   print DID for one key (default test key)
+ *        print_did --stdin     read one hex key per line, print one DID per
+ *                              line (empty line on error) until EOF
+ *
  * Build: cc -o print_did print_did.c ../build/liblcore.a -I../include -lmbedtls -lmbedcrypto
  */
 
@@ -30,9 +34,50 @@ int hex_to_bytes(const char* hex, uint8_t* out, size_t out_len) {
     return 0;
 }
 
+/* Persistent mode: amortizes process start-up across many keys */
+static int run_stdin(void) {
+    char line[256];
+    uint8_t privkey[32];
+    char did[128];
+
+    while (fgets(line, sizeof(line), stdin) != NULL) {
+        int too_long = 0;
+
+        if (strchr(line, '\n') == NULL && !feof(stdin)) {
+            /* Overlong line: drain the rest so it still gets a single answer */
+            int c;
+            while ((c = getchar()) != '\n' && c != EOF) {
+            }
+            too_long = 1;
+        }
+
+        line[strcspn(line, "\r\n")] = '\0';
+        did[0] = '\0';
+
+        if (too_long || hex_to_bytes(line, privkey, 32) != 0) {
+            fprintf(stderr, "Invalid hex key (need 64 hex chars)\n");
+        } else {
+            int ret = lcore_did_from_privkey(privkey, did, sizeof(did));
+            if (ret != LCORE_OK) {
+                fprintf(stderr, "Error: %d\n", ret);
+                did[0] = '\0';
+            }
+        }
+
+        /* Exactly one line per input line so callers stay in sync */
+        printf("%s\n", did);
+        fflush(stdout);
+    }
+    return 0;
+}
+
 int main(int argc, char** argv) {
     uint8_t privkey[32];
 
+    if (argc > 1 && strcmp(argv[1], "--stdin") == 0) {
+        return run_stdin();
+    }
+
     if (argc > 1) {
         /* Parse hex key from command line */
         if (hex_to_bytes(argv[1], privkey, 32) != 0) {
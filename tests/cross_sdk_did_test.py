@@ -8,6 +8,7 @@ strings from the same private key.
 Run: python tests/cross_sdk_did_test.py
 """
 
+import hashlib
 import subprocess
 import sys
 import os
@@ -17,6 +18,9 @@ import os
 TEST_PRIVKEY_HEX = "0102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f20"
 TEST_PRIVKEY_BYTES = bytes.fromhex(TEST_PRIVKEY_HEX)
 
+# Larger deterministic key corpus, checked through the persistent C helper
+CORPUS_PRIVKEY_HEXES = [hashlib.sha256(bytes([i])).hexdigest() for i in range(16)]
+
 def test_python_sdk():
     """Generate DID using Python SDK"""
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'packages', 'python'))
@@ -25,20 +29,76 @@ def test_python_sdk():
     device = DeviceIdentity.from_private_key(TEST_PRIVKEY_BYTES)
     return device.did
 
-def test_c_sdk():
-    """Generate DID using C SDK print_did tool"""
-    c_tool_path = os.path.join(os.path.dirname(__file__), '..', 'packages', 'c', 'tools', 'print_did')
+def python_sdk_dids(privkey_hexes):
+    """Generate DIDs for a key corpus using Python SDK"""
+    from lcore import DeviceIdentity
 
-    if not os.path.exists(c_tool_path):
-        return None
+    return [DeviceIdentity.from_private_key(bytes.fromhex(key)).did for key in privkey_hexes]
+
+class CDidHelper:
+    """Persistent `print_did --stdin` process: one hex key in, one DID out.
+
+    Keeps a single child alive so many keys cost one fork+exec in total.
+    """
+
+    def __init__(self, tool_path):
+        self.proc = subprocess.Popen(
+            [tool_path, '--stdin'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1
+        )
+
+    def did(self, privkey_hex):
+        try:
+            self.proc.stdin.write(privkey_hex + '\n')
+            self.proc.stdin.flush()
+        except BrokenPipeError:
+            return None
+        return self.proc.stdout.readline().strip() or None
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
+C_TOOL_PATH = os.path.join(os.path.dirname(__file__), '..', 'packages', 'c', 'tools', 'print_did')
+
+def _c_sdk_did_once(privkey_hex):
+    """One-shot print_did call (works with binaries that predate --stdin)"""
     result = subprocess.run(
-        [c_tool_path, TEST_PRIVKEY_HEX],
+        [C_TOOL_PATH, privkey_hex],
         capture_output=True, text=True
     )
 
     return result.stdout.strip() if result.returncode == 0 else None
 
+def c_sdk_dids(privkey_hexes):
+    """Generate DIDs for a key corpus through one C SDK helper process
+
+    Keys the helper could not answer come back as None (e.g. a print_did
+    binary built before --stdin existed).
+    """
+    if not os.path.exists(C_TOOL_PATH):
+        return None
+
+    with CDidHelper(C_TOOL_PATH) as helper:
+        return [helper.did(key) for key in privkey_hexes]
+
+def test_c_sdk():
+    """Generate DID using C SDK print_did tool"""
+    if not os.path.exists(C_TOOL_PATH):
+        return None
+
+    return _c_sdk_did_once(TEST_PRIVKEY_HEX)
+
 def test_typescript_sdk():
     """Generate DID using TypeScript SDK (if DeviceIdentity exists)"""
     ts_path = os.path.join(os.path.dirname(__file__), '..', 'packages', 'typescript')
@@ -120,6 +180,27 @@ def main():
         print(f"✗ Error: {e}")
         results['typescript'] = None
 
+    # Key corpus: Python SDK vs persistent C helper
+    corpus_ok = True
+    if results['python'] and results['c']:
+        print(f"Testing C SDK helper on {len(CORPUS_PRIVKEY_HEXES)} keys...", end=" ")
+        try:
+            expected = python_sdk_dids(CORPUS_PRIVKEY_HEXES)
+            got = c_sdk_dids(CORPUS_PRIVKEY_HEXES)
+            failed = sum(1 for did in got if did is None)
+            mismatched = sum(1 for e, g in zip(expected, got) if g is not None and e != g)
+            if failed:
+                print(f"✗ Helper failed on {failed} keys (rebuild print_did with --stdin)")
+                corpus_ok = False
+            elif mismatched:
+                print(f"✗ MISMATCH on {mismatched} keys")
+                corpus_ok = False
+            else:
+                print("✓ All match Python SDK")
+        except Exception as e:
+            print(f"✗ Error: {e}")
+            corpus_ok = False
+
     # Compare results
     print()
     print("=" * 50)
@@ -135,7 +216,7 @@ def main():
     if len(unique_dids) == 1:
         print(f"✓ All SDKs produce identical DID:")
         print(f"  {list(unique_dids)[0]}")
-        return 0
+        return 0 if corpus_ok else 1
     else:
         print("✗ MISMATCH! SDKs produce different DIDs:")
         for sdk, did in valid_results.items():
@@ -11,19 +11,46 @@ Run on Pi 5:
 Or without Sense HAT (mock data):
     pip install httpx coincurve
     python pi5_continuous_test.py
+
+Optional native speedups (used automatically when installed):
+    pip install based58 orjson pybase64 'httpx[http2]' uvloop
 """
 
 import os
+import re
 import sys
 import json
 import time
-import base64
 import hashlib
 import asyncio
+import concurrent.futures
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Any, Union
 
 import httpx
+from coincurve import PrivateKey
+from coincurve._libsecp256k1 import ffi, lib
+
+try:
+    from based58 import b58encode as _b58encode
+except ImportError:
+    _b58encode = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pybase64 import urlsafe_b64encode as _urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64encode as _urlsafe_b64encode
+
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
 
 # EigenCloud endpoints
 ATTESTOR_URL = "http://104.197.228.179:8001"
@@ -32,6 +59,10 @@ CARTESI_URL = "http://34.70.167.143:10000"
 # Submission interval (seconds)
 INTERVAL = 10
 
+# Readings buffered while the attestor is slow, and max concurrent POSTs
+QUEUE_SIZE = 64
+MAX_IN_FLIGHT = 8
+
 # Device identity file
 DEVICE_FILE = os.path.expanduser("~/.lcore_device.json")
 
@@ -41,18 +72,32 @@ DEVICE_FILE = os.path.expanduser("~/.lcore_device.json")
 # ============================================================
 
 def _base58btc_encode(data: bytes) -> str:
-    ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+    if _b58encode is not None:
+        return "z" + _b58encode(data).decode()
+    return _base58btc_encode_py(data)
+
+
+_B58_TABLE = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz" + bytes(range(58, 256))
+
+
+_B58_CHUNK_DIGITS = 10
+_B58_CHUNK = 58 ** _B58_CHUNK_DIGITS
+
+
+def _base58btc_encode_py(data: bytes) -> str:
     n = int.from_bytes(data, "big")
-    result = []
+    digits = bytearray()
+    while n >= _B58_CHUNK:
+        n, chunk = divmod(n, _B58_CHUNK)
+        for _ in range(_B58_CHUNK_DIGITS):
+            chunk, r = divmod(chunk, 58)
+            digits.append(r)
     while n > 0:
         n, r = divmod(n, 58)
-        result.append(ALPHABET[r])
-    for b in data:
-        if b == 0:
-            result.append(ALPHABET[0])
-        else:
-            break
-    return "z" + "".join(reversed(result))
+        digits.append(r)
+    digits.extend(bytes(len(data) - len(data.lstrip(b"\x00"))))
+    digits.reverse()
+    return "z" + digits.translate(_B58_TABLE).decode()
 
 
 def public_key_to_did_key(public_key: bytes) -> str:
@@ -60,34 +105,48 @@ def public_key_to_did_key(public_key: bytes) -> str:
     return f"did:key:{_base58btc_encode(multicodec)}"
 
 
-def _base64url_encode(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
 
 
-def create_jws(payload: dict, private_key: bytes) -> str:
-    from coincurve import PrivateKey
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    header = {"alg": "ES256K", "typ": "JWT"}
-    header_b64 = _base64url_encode(json.dumps(header, separators=(",", ":")).encode())
-    payload_b64 = _base64url_encode(json.dumps(payload, separators=(",", ":")).encode())
 
-    message = f"{header_b64}.{payload_b64}".encode()
-    msg_hash = hashlib.sha256(message).digest()
+def _base64url_bytes(data: bytes) -> bytes:
+    return _urlsafe_b64encode(data).rstrip(b"=")
 
-    priv = PrivateKey(private_key)
-    sig = priv.sign(msg_hash, hasher=None)
 
-    r_len = sig[3]
-    r = sig[4 : 4 + r_len]
-    s_start = 4 + r_len + 2
-    s_len = sig[s_start - 1]
-    s = sig[s_start : s_start + s_len]
+# Single libsecp256k1 signing context for the process (randomized once)
+_SECP256K1_CONTEXT_SIGN = 0x0201
+_CTX = ffi.gc(lib.secp256k1_context_create(_SECP256K1_CONTEXT_SIGN), lib.secp256k1_context_destroy)
+lib.secp256k1_context_randomize(_CTX, os.urandom(32))
 
-    r = r[-32:].rjust(32, b"\x00")
-    s = s[-32:].rjust(32, b"\x00")
 
-    sig_b64 = _base64url_encode(r + s)
-    return f"{header_b64}.{payload_b64}.{sig_b64}"
+_JWS_HEADER_B64 = _base64url_bytes(b'{"alg":"ES256K","typ":"JWT"}')
+
+
+def create_jws(payload: dict, private_key: bytes) -> str:
+    header_b64 = _JWS_HEADER_B64
+    payload_b64 = _base64url_bytes(_json_dumps(payload))
+
+    message = header_b64 + b"." + payload_b64
+    msg_hash = hashlib.sha256(message).digest()
+
+    if len(private_key) != 32:
+        raise ValueError(f"Private key must be 32 bytes, got {len(private_key)}")
+    sig = ffi.new("secp256k1_ecdsa_signature *")
+    if not lib.secp256k1_ecdsa_sign(_CTX, sig, msg_hash, private_key, ffi.NULL, ffi.NULL):
+        raise ValueError("secp256k1 signing failed (invalid private key?)")
+    compact = ffi.new("unsigned char[64]")
+    lib.secp256k1_ecdsa_signature_serialize_compact(_CTX, compact, sig)
+
+    sig_b64 = _base64url_bytes(ffi.buffer(compact, 64)[:])
+    return (message + b"." + sig_b64).decode()
 
 
 # ============================================================
@@ -102,7 +161,6 @@ class DeviceIdentity:
 
     @classmethod
     def generate(cls) -> "DeviceIdentity":
-        from coincurve import PrivateKey
         private_key = os.urandom(32)
         priv = PrivateKey(private_key)
         public_key = priv.public_key.format(compressed=True)
@@ -111,7 +169,6 @@ class DeviceIdentity:
 
     @classmethod
     def from_hex(cls, hex_key: str) -> "DeviceIdentity":
-        from coincurve import PrivateKey
         if hex_key.startswith("0x"):
             hex_key = hex_key[2:]
         private_key = bytes.fromhex(hex_key)
@@ -120,15 +177,23 @@ class DeviceIdentity:
         did = public_key_to_did_key(public_key)
         return cls(private_key=private_key, public_key=public_key, did=did)
 
-    def sign(self, payload: dict) -> dict:
+    def sign(
+        self,
+        payload: dict,
+        *,
+        timestamp: Optional[int] = None,
+        as_bytes: bool = False,
+    ) -> Union[dict, bytes]:
         signature = create_jws(payload, self.private_key)
-        timestamp = int(time.time())
-        return {
+        if timestamp is None:
+            timestamp = int(time.time())
+        submission = {
             "did": self.did,
             "payload": payload,
             "signature": signature,
             "timestamp": timestamp,
         }
+        return _json_dumps(submission) if as_bytes else submission
 
     def save(self, path: str):
         with open(path, "w") as f:
@@ -149,23 +214,37 @@ sense = None
 
 
 def init_sense_hat():
-    """Initialize Sense HAT (lazy load)."""
+    """Initialize Sense HAT and pre-warm its sensors (lazy load)."""
     global sense
     if sense is not None:
         return True
 
     try:
         from sense_hat import SenseHat
+        start = time.perf_counter()
         sense = SenseHat()
-        print("[INFO] Sense HAT initialized")
+        # Warm up: the first reads trigger HTS221/LPS25H calibration reads
+        sense.get_temperature(), sense.get_humidity(), sense.get_pressure()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"[INFO] Sense HAT initialized (probe + warmup {elapsed_ms:.0f} ms)")
         return True
     except ImportError:
         print("[WARN] Sense HAT not available - using mock data")
         return False
 
 
-def get_sensor_data() -> dict:
-    """Read from Sense HAT or return mock data."""
+# Sense HAT reads are blocking I2C calls; run them on one worker thread
+# (the bus is serialized anyway) so the event loop stays responsive.
+_sensor_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="sensehat")
+
+
+async def get_sensor_data() -> dict:
+    """Read from Sense HAT (off the event loop) or return mock data."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_sensor_executor, _read_sensor_sync)
+
+
+def _read_sensor_sync() -> dict:
     if sense is not None:
         return {
             "temperature": round(sense.get_temperature(), 2),
@@ -200,27 +279,42 @@ def get_device() -> DeviceIdentity:
 # Submission
 # ============================================================
 
-async def submit_once(client: httpx.AsyncClient, device: DeviceIdentity) -> bool:
-    """Submit one sensor reading."""
-    payload = get_sensor_data()
-    payload["timestamp_local"] = int(time.time())
+def make_client() -> httpx.AsyncClient:
+    """Create the long-lived HTTP client (keep-alive pool, HTTP/2 if available)."""
+    return httpx.AsyncClient(
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+        headers={"Content-Type": "application/json"},
+        timeout=30.0,
+    )
+
+
+# On success only txHash/blockNumber are shown, so skip the full JSON parse
+_TX_HASH_RE = re.compile(rb'"txHash"\s*:\s*"(0x[0-9a-fA-F]{0,64})"')
+_BLOCK_NUMBER_RE = re.compile(rb'"blockNumber"\s*:\s*(\d+)')
 
-    submission = device.sign(payload)
+
+async def submit_once(client: httpx.AsyncClient, device: DeviceIdentity, payload: dict) -> bool:
+    """Submit one sensor reading."""
+    body = device.sign(payload, as_bytes=True)
 
     try:
         resp = await client.post(
             f"{ATTESTOR_URL}/api/device/submit",
-            json=submission,
+            content=body,
             timeout=30.0,
         )
-        data = resp.json()
+        raw = resp.content
 
         if resp.status_code == 201:
-            tx = data.get("data", {}).get("txHash", "?")[:16]
-            block = data.get("data", {}).get("blockNumber", "?")
+            tx_match = _TX_HASH_RE.search(raw)
+            block_match = _BLOCK_NUMBER_RE.search(raw)
+            tx = tx_match.group(1)[:16].decode() if tx_match else "?"
+            block = block_match.group(1).decode() if block_match else "?"
             print(f"[OK] temp={payload['temperature']}°C hum={payload['humidity']}% | tx={tx}... block={block}")
             return True
         else:
+            data = _json_loads(raw)
             error = data.get("error", f"HTTP {resp.status_code}")
             print(f"[ERR] {error[:80]}")
             return False
@@ -238,6 +332,65 @@ async def check_health(client: httpx.AsyncClient) -> bool:
         return False
 
 
+async def sample_loop(queue: asyncio.Queue) -> None:
+    """Read the sensor on a fixed INTERVAL cadence and queue each reading."""
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    while True:
+        payload = await get_sensor_data()
+        payload["timestamp_local"] = int(time.time())
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            print("[WARN] Submission backlog full - dropping reading")
+
+        # Wait for next interval (independent of how long submissions take)
+        next_tick += INTERVAL
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+async def submit_loop(
+    client: httpx.AsyncClient,
+    device: DeviceIdentity,
+    queue: asyncio.Queue,
+    stats: dict,
+) -> None:
+    """Submit queued readings concurrently, at most MAX_IN_FLIGHT at a time."""
+    in_flight = asyncio.Semaphore(MAX_IN_FLIGHT)
+    pending = set()
+
+    async def submit(payload: dict) -> None:
+        try:
+            ok = await submit_once(client, device, payload)
+            # Only count requests that completed (not ones cancelled on shutdown)
+            stats["total"] += 1
+            if ok:
+                stats["success"] += 1
+        finally:
+            in_flight.release()
+
+    try:
+        while True:
+            payload = await queue.get()
+            await in_flight.acquire()
+            task = asyncio.create_task(submit(payload))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def run(coro) -> None:
+    """Run coro on uvloop when installed, else on the default asyncio loop."""
+    try:
+        from uvloop import run as _run
+    except ImportError:
+        _run = asyncio.run
+    _run(coro)
+
+
 async def main():
     """Run continuous submission loop."""
     print("=" * 60)
@@ -254,11 +407,10 @@ async def main():
     print()
 
     # Stats
-    total = 0
-    success = 0
+    stats = {"total": 0, "success": 0}
     start_time = time.time()
 
-    async with httpx.AsyncClient() as client:
+    async with make_client() as client:
         # Initial health check
         if not await check_health(client):
             print("[ERR] Attestor not responding - check connection")
@@ -267,26 +419,22 @@ async def main():
         print("[INFO] Starting continuous submission (Ctrl+C to stop)")
         print("-" * 60)
 
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
         try:
-            while True:
-                total += 1
-                if await submit_once(client, device):
-                    success += 1
-
-                # Wait for next interval
-                await asyncio.sleep(INTERVAL)
-
-        except KeyboardInterrupt:
-            pass
-
-    # Summary
-    elapsed = time.time() - start_time
-    print()
-    print("-" * 60)
-    print(f"Summary: {success}/{total} successful ({success/total*100:.1f}%)")
-    print(f"Runtime: {elapsed/60:.1f} minutes")
-    print("=" * 60)
+            await asyncio.gather(
+                sample_loop(queue),
+                submit_loop(client, device, queue, stats),
+            )
+        finally:
+            # Summary (printed on Ctrl+C / cancellation, which still propagates)
+            total, success = stats["total"], stats["success"]
+            elapsed = time.time() - start_time
+            print()
+            print("-" * 60)
+            print(f"Summary: {success}/{total} successful ({success/max(total, 1)*100:.1f}%)")
+            print(f"Runtime: {elapsed/60:.1f} minutes")
+            print("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
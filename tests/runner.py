@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+E2E Runner: all async Python E2E scripts on one event loop
+
+Runs each script's main() back to back with run_until_complete instead of a
+separate asyncio.run() per script, so the loop is created once.
+
+Run:
+    python tests/runner.py                 # standalone + SDK E2E tests
+    python tests/runner.py --continuous    # ...then the continuous loop (Ctrl+C to stop)
+"""
+
+import os
+import sys
+import asyncio
+import importlib
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# One-shot E2E scripts, in run order
+SCRIPTS = ["pi5_sensehat_test", "test_eigencloud_e2e"]
+
+# Never returns on its own, so only run last and on request
+CONTINUOUS_SCRIPT = "pi5_continuous_test"
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop when installed, else the default asyncio loop."""
+    try:
+        from uvloop import new_event_loop as _new_event_loop
+    except ImportError:
+        _new_event_loop = asyncio.new_event_loop
+    return _new_event_loop()
+
+
+def main() -> int:
+    scripts = list(SCRIPTS)
+    if "--continuous" in sys.argv[1:]:
+        scripts.append(CONTINUOUS_SCRIPT)
+
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    failed = []
+
+    try:
+        for name in scripts:
+            try:
+                module = importlib.import_module(name)
+                loop.run_until_complete(module.main())
+            except KeyboardInterrupt:
+                # Let the running script see the cancellation and print its summary
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                break
+            except Exception as e:
+                print(f"[ERR] {name}: {e}")
+                failed.append(name)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
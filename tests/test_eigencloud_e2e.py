@@ -11,19 +11,36 @@ Tests the complete L{CORE} data flow:
 Run on Pi 5:
     pip install -e packages/python
     pip install sense-hat  # or sense-emu for testing without hardware
+    pip install uvloop     # optional, faster event loop
     python tests/test_eigencloud_e2e.py
 """
 
 import asyncio
+import json
 import sys
 import os
 import time
 
-# Add packages/python to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "packages", "python", "src"))
+import httpx
 
-from client import LCore
-from device import DeviceIdentity
+# Python SDK: installed package, else packages/python/src aliased as 'lcore'
+# (same as packages/python/conftest.py)
+try:
+    import lcore
+except ImportError:
+    import importlib.util
+
+    _src_dir = os.path.join(os.path.dirname(__file__), "..", "packages", "python", "src")
+    _spec = importlib.util.spec_from_file_location(
+        "lcore",
+        os.path.join(_src_dir, "__init__.py"),
+        submodule_search_locations=[_src_dir],
+    )
+    lcore = importlib.util.module_from_spec(_spec)
+    sys.modules["lcore"] = lcore
+    _spec.loader.exec_module(lcore)
+
+from lcore import LCore, DeviceIdentity
 
 # EigenCloud endpoints
 ATTESTOR_URL = "http://104.197.228.179:8001"
@@ -33,6 +50,26 @@ DAPP_ADDRESS = "0xCe5d7Fd245De833eEC7BDbeEb10b75D0e13E9Ec4"
 # Device identity file (persistent across runs)
 DEVICE_FILE = os.path.expanduser("~/.lcore_device.json")
 
+# HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Optional C-backed JSON parser for Cartesi responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Parse a JSON response body (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def get_sense_hat_data() -> dict:
     """Read real sensor data from Sense HAT."""
@@ -70,33 +107,39 @@ def get_or_create_device() -> DeviceIdentity:
     return device
 
 
-async def test_health():
+def make_client() -> httpx.AsyncClient:
+    """Create the HTTP client shared by all Cartesi queries (keep-alive pool)."""
+    return httpx.AsyncClient(
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+        timeout=30.0,
+    )
+
+
+async def test_health(lcore: LCore, client: httpx.AsyncClient):
     """Test that EigenCloud services are responding."""
     print("\n=== Health Check ===")
 
-    async with LCore(attestor_url=ATTESTOR_URL, cartesi_url=CARTESI_URL) as lcore:
-        # Check attestor
-        healthy = await lcore.health_check()
-        status = "OK" if healthy else "FAILED"
-        print(f"Attestor ({ATTESTOR_URL}): {status}")
-
-        # Check Cartesi via GraphQL
-        import httpx
-        try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{CARTESI_URL}/graphql",
-                    json={"query": "{ inputs { totalCount } }"},
-                    timeout=10.0,
-                )
-                data = resp.json()
-                count = data.get("data", {}).get("inputs", {}).get("totalCount", "?")
-                print(f"Cartesi ({CARTESI_URL}): OK - {count} inputs")
-        except Exception as e:
-            print(f"Cartesi ({CARTESI_URL}): FAILED - {e}")
-
-
-async def test_submit():
+    # Check attestor
+    healthy = await lcore.health_check()
+    status = "OK" if healthy else "FAILED"
+    print(f"Attestor ({ATTESTOR_URL}): {status}")
+
+    # Check Cartesi via GraphQL
+    try:
+        resp = await client.post(
+            f"{CARTESI_URL}/graphql",
+            json={"query": "{ inputs { totalCount } }"},
+            timeout=10.0,
+        )
+        data = _json_loads(resp.content)
+        count = data.get("data", {}).get("inputs", {}).get("totalCount", "?")
+        print(f"Cartesi ({CARTESI_URL}): OK - {count} inputs")
+    except Exception as e:
+        print(f"Cartesi ({CARTESI_URL}): FAILED - {e}")
+
+
+async def test_submit(lcore: LCore):
     """Submit real sensor data to EigenCloud."""
     print("\n=== Sensor Data Submission ===")
 
@@ -110,64 +153,60 @@ async def test_submit():
     print(f"Sensor data: {payload}")
 
     # Submit to EigenCloud
-    async with LCore(
-        attestor_url=ATTESTOR_URL,
-        cartesi_url=CARTESI_URL,
-        dapp_address=DAPP_ADDRESS,
-    ) as lcore:
-        print("\n[INFO] Submitting to EigenCloud...")
-        result = await lcore.submit_device_data(device, payload)
-
-        if result.success:
-            print(f"\n[SUCCESS] Data submitted!")
-            print(f"  TX Hash: {result.tx_hash}")
-            print(f"  Block: {result.block_number}")
-            return True
-        else:
-            print(f"\n[FAILED] {result.error}")
-            return False
+    print("\n[INFO] Submitting to EigenCloud...")
+    result = await lcore.submit_device_data(device, payload)
+
+    if result.success:
+        print(f"\n[SUCCESS] Data submitted!")
+        print(f"  TX Hash: {result.tx_hash}")
+        print(f"  Block: {result.block_number}")
+        return True
+    else:
+        print(f"\n[FAILED] {result.error}")
+        return False
 
 
-async def test_query():
+async def test_query(client: httpx.AsyncClient):
     """Query device attestations from Cartesi."""
     print("\n=== Query Attestations ===")
 
-    device = get_or_create_device()
-
-    async with LCore(
-        attestor_url=ATTESTOR_URL,
-        cartesi_url=CARTESI_URL,
-    ) as lcore:
-        # Query all inputs
-        import httpx
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{CARTESI_URL}/graphql",
-                json={
-                    "query": """
-                        query {
-                            inputs(last: 5) {
-                                edges {
-                                    node {
-                                        index
-                                        status
-                                        timestamp
-                                        msgSender
-                                    }
-                                }
+    # Query all inputs
+    resp = await client.post(
+        f"{CARTESI_URL}/graphql",
+        json={
+            "query": """
+                query {
+                    inputs(last: 5) {
+                        edges {
+                            node {
+                                index
+                                status
+                                timestamp
+                                msgSender
                             }
                         }
-                    """
-                },
-                timeout=10.0,
-            )
-            data = resp.json()
-            inputs = data.get("data", {}).get("inputs", {}).get("edges", [])
-
-            print(f"Recent inputs: {len(inputs)}")
-            for edge in inputs:
-                node = edge.get("node", {})
-                print(f"  - Index {node.get('index')}: {node.get('status')} @ {node.get('timestamp')}")
+                    }
+                }
+            """
+        },
+        timeout=10.0,
+    )
+    data = _json_loads(resp.content)
+    inputs = data.get("data", {}).get("inputs", {}).get("edges", [])
+
+    print(f"Recent inputs: {len(inputs)}")
+    for edge in inputs:
+        node = edge.get("node", {})
+        print(f"  - Index {node.get('index')}: {node.get('status')} @ {node.get('timestamp')}")
+
+
+def run(coro) -> None:
+    """Run coro on uvloop when installed, else on the default asyncio loop."""
+    try:
+        from uvloop import run as _run
+    except ImportError:
+        _run = asyncio.run
+    _run(coro)
 
 
 async def main():
@@ -179,15 +218,20 @@ async def main():
     print(f"Cartesi:  {CARTESI_URL}")
     print(f"DApp:     {DAPP_ADDRESS}")
 
-    # Run tests
-    await test_health()
-    success = await test_submit()
+    # Run tests (one LCore client and one Cartesi client reused throughout)
+    async with LCore(
+        attestor_url=ATTESTOR_URL,
+        cartesi_url=CARTESI_URL,
+        dapp_address=DAPP_ADDRESS,
+    ) as lcore, make_client() as client:
+        await test_health(lcore, client)
+        success = await test_submit(lcore)
 
-    if success:
-        # Wait for Cartesi to process
-        print("\n[INFO] Waiting 5s for Cartesi to process...")
-        await asyncio.sleep(5)
-        await test_query()
+        if success:
+            # Wait for Cartesi to process
+            print("\n[INFO] Waiting 5s for Cartesi to process...")
+            await asyncio.sleep(5)
+            await test_query(client)
 
     print("\n" + "=" * 60)
     print("E2E Test Complete")
@@ -195,4 +239,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())